@@ -1,12 +1,66 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, literal, make_url, select
 from sqlalchemy.orm import sessionmaker
-from schema import Base
+from schema import Base, PipeEdge
 
 # SQLite database file
 DATABASE_URL = "sqlite:///sewer_database.db"
 
+# Number of compiled SQL statements kept in the engine's LRU cache
+QUERY_CACHE_SIZE = 1200
+
+# Connection pool settings for client/server databases (e.g., PostgreSQL):
+# connections are reused across sessions, checked before use, and replaced
+# after 30 minutes so they are not dropped by the server or a firewall
+POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+# Maximum number of rows sent in one multi-row INSERT ... VALUES statement
+# when many rows are inserted at once (e.g., conn.execute(insert(Defect), rows))
+INSERTMANYVALUES_PAGE_SIZE = 10_000
+
+# psycopg2 executemany settings: UPDATE and DELETE with many parameter sets
+# are sent in batches of 500 statements (psycopg 3 batches them already)
+PSYCOPG2_OPTIONS = {
+    "executemany_mode": "values_plus_batch",
+    "executemany_batch_page_size": 500,
+}
+
+# Engine factory
+def make_engine(url, **kwargs):
+    """
+    Create an engine with a bounded compiled-statement cache, so repeated
+    ORM queries (e.g. select(Pipe).where(Pipe.Pipe_ID == pipe_id)) reuse
+    their compiled SQL instead of being recompiled on every execution.
+
+    The cache is keyed on the statement structure, not on its values:
+    pass values as bound parameters (bindparam or ORM expressions). Raw
+    text() statements with inline literals produce a new cache entry for
+    every distinct value.
+
+    Engines for client/server databases keep a pool of open connections
+    (POOL_OPTIONS), so short-lived sessions do not pay the cost of a new
+    connection each time.
+
+    Inserts of many rows are sent as multi-row INSERT statements of up to
+    INSERTMANYVALUES_PAGE_SIZE rows instead of one statement per row.
+    """
+    url = make_url(url)
+    options = {"query_cache_size": QUERY_CACHE_SIZE, "insertmanyvalues_page_size": INSERTMANYVALUES_PAGE_SIZE}
+    if url.get_backend_name() != "sqlite":
+        options.update(POOL_OPTIONS)
+    if url.get_dialect().driver == "psycopg2":
+        options.update(PSYCOPG2_OPTIONS)
+
+    for option, value in options.items():
+        kwargs.setdefault(option, value)
+    return create_engine(url, future=True, **kwargs)
+
 # Create the engine (connection to the DB)
-engine = create_engine(
+engine = make_engine(
     DATABASE_URL,
     echo=True,
 )
@@ -16,4 +70,58 @@ SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False
 
 # Create all tables in the database
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    """
+    Create the tables, indexes, partitions and views in a single transaction
+    (one BEGIN/COMMIT for the whole schema). Tables that already exist are
+    skipped, so it is safe to run again on an existing database.
+    """
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+
+# Refresh the pre-aggregated views after loading new data
+def refresh_views():
+    """
+    Recompute the materialized views defined in schema.py (PostgreSQL).
+    Plain views on other databases are always up to date.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("REFRESH MATERIALIZED VIEW CONCURRENTLY pipe_condition_summary")
+
+# Network traversal
+def upstream_manholes(conn, manhole_id, max_hops=None):
+    """
+    Return the identifiers of the manholes upstream of a manhole, following
+    the pipe network (PipeEdge) with a recursive query.
+
+    Parameters
+    ----------
+    conn : sqlalchemy.Connection or sqlalchemy.orm.Session
+        Open connection or session.
+    manhole_id : int
+        Manhole where the search starts.
+    max_hops : int, optional
+        Maximum number of pipes between the start and an upstream manhole.
+        Default is None (the whole upstream network).
+    """
+    edge = PipeEdge.__table__
+    start = select(edge.c.Manhole_from_ID.label("Manhole_ID")).where(edge.c.Manhole_to_ID == manhole_id)
+
+    if max_hops is None:
+        # UNION (not UNION ALL) visits each manhole once, so loops in the network terminate
+        upstream = start.cte("upstream", recursive=True)
+        upstream = upstream.union(
+            select(edge.c.Manhole_from_ID).join(upstream, edge.c.Manhole_to_ID == upstream.c.Manhole_ID)
+        )
+    else:
+        upstream = start.add_columns(literal(1).label("hops")).cte("upstream", recursive=True)
+        upstream = upstream.union_all(
+            select(edge.c.Manhole_from_ID, upstream.c.hops + 1)
+            .join(upstream, edge.c.Manhole_to_ID == upstream.c.Manhole_ID)
+            .where(upstream.c.hops < max_hops)
+        )
+
+    query = select(upstream.c.Manhole_ID).where(upstream.c.Manhole_ID.is_not(None)).distinct()
+    return list(conn.scalars(query))
@@ -0,0 +1,350 @@
+"""
+Bulk loaders for the sewer database
+===================================
+
+Helpers for loading large pandas DataFrames (e.g., CCTV defect exports or
+weather station histories) into the tables defined in `schema.py`.
+
+- PostgreSQL (psycopg 3): rows are streamed with COPY ... FROM STDIN.
+- Other databases (e.g., SQLite): rows are inserted with executemany,
+  inside a single transaction.
+
+In both cases the DataFrame is sent in chunks of `chunksize` rows, so
+memory use stays bounded for very large files.
+
+Pipe categories stored in lookup tables (e.g., Material) can be loaded by
+name: a "Material" column in the DataFrame is translated to "Material_ID",
+and names not yet in the lookup table are added to it.
+
+Rainfall, air humidity and air temperature sheets keep loading into
+WeatherObservation: their value column (e.g., "Intensity") fills "Value"
+and "Variable".
+
+Locations (e.g., of manholes) can be loaded from "X_coordinate" and
+"Y_coordinate" columns, which are converted to points in the schema's
+spatial reference system.
+
+Initial or bulk imports (e.g., into WeatherObservation) can run with the
+table's secondary indexes dropped (see `deferred_indexes`), so each index is
+rebuilt once after the load instead of being updated row by row.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
+
+import pandas as pd
+from sqlalchemy import insert, inspect, select
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from schema import SpatialLocation, WeatherObservation, WeatherVariable
+
+# Number of DataFrame rows sent to the database per call
+CHUNK_SIZE = 10_000
+
+# Maximum number of indexes rebuilt in parallel after a bulk load (PostgreSQL)
+INDEX_BUILD_WORKERS = 4
+
+# Value columns of the former rainfall, air humidity and air temperature
+# tables, loaded into WeatherObservation.Value
+LEGACY_WEATHER_VALUES = {
+    "Intensity": WeatherVariable.RAINFALL,
+    "Humidity_value": WeatherVariable.HUMIDITY,
+    "Temperature_value": WeatherVariable.TEMPERATURE,
+}
+
+
+def _create_index_sql(index, dialect):
+    """
+    Compile the CREATE INDEX statement of an index. On PostgreSQL the index
+    is built CONCURRENTLY so the table stays writable during the rebuild
+    (not supported on partitioned tables, which are indexed normally).
+    """
+    if dialect.name != "postgresql" or index.table.dialect_options["postgresql"]["partition_by"]:
+        return str(CreateIndex(index).compile(dialect=dialect))
+
+    options = index.dialect_options["postgresql"]
+    concurrently = options["concurrently"]
+    options["concurrently"] = True
+    try:
+        return str(CreateIndex(index).compile(dialect=dialect))
+    finally:
+        options["concurrently"] = concurrently
+
+
+def _run_autocommit(engine, sql):
+    """
+    Execute one statement on its own pooled connection, outside a
+    transaction (required by CREATE INDEX CONCURRENTLY).
+    """
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").exec_driver_sql(sql)
+
+
+@contextmanager
+def deferred_indexes(engine, model):
+    """
+    Drop the secondary indexes of a model's table for the duration of a
+    bulk load, and rebuild them when the block exits.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.Engine
+        SQLAlchemy engine connected to the target database.
+    model : Base subclass
+        SQLAlchemy ORM model class whose indexes are deferred.
+
+    Notes
+    -----
+    - Only the indexes declared on the model that exist in the database are
+      dropped (e.g., PostgreSQL-only indexes are skipped on SQLite); primary
+      keys and the indexes backing unique constraints are kept.
+    - On PostgreSQL the indexes are rebuilt in parallel, each on its own
+      connection. Other databases rebuild them one after another.
+    - Do not use it on tables referenced by foreign keys during the load
+      (e.g., Pipe).
+    """
+    table = model.__table__
+    existing = {index["name"] for index in inspect(engine).get_indexes(table.name)}
+    indexes = [index for index in table.indexes if index.name in existing]
+    statements = [_create_index_sql(index, engine.dialect) for index in indexes]
+
+    with engine.begin() as conn:
+        for index in indexes:
+            conn.execute(DropIndex(index))
+
+    try:
+        yield
+    finally:
+        if engine.dialect.name == "postgresql" and statements:
+            workers = min(len(statements), INDEX_BUILD_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda sql: _run_autocommit(engine, sql), statements))
+        else:
+            with engine.begin() as conn:
+                for sql in statements:
+                    conn.exec_driver_sql(sql)
+
+
+def _iter_rows(df, chunksize):
+    """
+    Yield the rows of the DataFrame as tuples, one chunk at a time.
+    pandas NA values are converted to None so they are stored as NULL.
+    """
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start:start + chunksize].astype(object)
+        chunk = chunk.where(pd.notna(chunk), None)
+        yield list(chunk.itertuples(index=False, name=None))
+
+
+def _encode_lookups(conn, table, df):
+    """
+    Replace category names with the identifiers of their lookup tables,
+    adding the names that are not yet stored.
+    """
+    for fk in table.foreign_keys:
+        lookup = fk.column.table
+        column = fk.parent.name
+        source = column[:-len("_ID")]
+        if not lookup.info.get("lookup") or source not in df.columns or column in df.columns:
+            continue
+
+        names = df[source].astype("string")
+        ids = dict(conn.execute(select(lookup.c.name, lookup.c.id)).all())
+        new_names = [name for name in names.dropna().unique() if name not in ids]
+        if new_names:
+            # Identifiers are assigned by the database, so its sequence stays in step
+            conn.execute(insert(lookup), [{"name": name} for name in new_names])
+            ids = dict(conn.execute(select(lookup.c.name, lookup.c.id)).all())
+
+        df = df.assign(**{column: names.map(ids).astype("Int16")}).drop(columns=source)
+    return df
+
+
+def _weather_values(table, df):
+    """
+    Load the value column of a former rainfall, air humidity or air
+    temperature sheet (e.g., "Intensity") into WeatherObservation.Value,
+    with the matching Variable when the DataFrame does not provide one.
+    """
+    legacy = [column for column in LEGACY_WEATHER_VALUES if column in df.columns]
+    if table is not WeatherObservation.__table__ or not legacy:
+        return df
+
+    if len(legacy) > 1 or "Value" in df.columns:
+        raise ValueError(
+            "Cannot load more than one of Value, %s into WeatherObservation.Value"
+            % ", ".join(legacy)
+        )
+
+    column = legacy[0]
+    df = df.rename(columns={column: "Value"})
+    if "Variable" not in df.columns:
+        df = df.assign(Variable=LEGACY_WEATHER_VALUES[column].value)
+    return df
+
+
+def _points_from_coordinates(table, df):
+    """
+    Build the point "Location" of a table from "X_coordinate" and
+    "Y_coordinate" DataFrame columns, as EWKT (e.g., SRID=2193;POINT(x y)).
+    """
+    location = table.c.get("Location")
+    if (
+        location is None
+        or not isinstance(location.type, SpatialLocation)
+        or location.type.geometry_type != "POINT"
+        or "Location" in df.columns
+        or not {"X_coordinate", "Y_coordinate"} <= set(df.columns)
+    ):
+        return df
+
+    srid = location.type.srid
+    points = [
+        f"SRID={srid};POINT({x} {y})" if pd.notna(x) and pd.notna(y) else None
+        for x, y in zip(df["X_coordinate"], df["Y_coordinate"])
+    ]
+    return df.assign(Location=points).drop(columns=["X_coordinate", "Y_coordinate"])
+
+
+def _fill_parent_keys(conn, table, df):
+    """
+    Complete composite foreign keys that the DataFrame only partly provides
+    (e.g., Defect.Inspection_date from Defect.Inspection_ID), by reading the
+    missing key columns from the referenced table.
+    """
+    for fk in table.foreign_key_constraints:
+        present = [col.name for col in fk.columns if col.name in df.columns]
+        missing = [col.name for col in fk.columns if col.name not in df.columns]
+        if not present or not missing:
+            continue
+
+        # Only read the referenced rows of the keys present in the DataFrame
+        referred = {element.parent.name: element.column for element in fk.elements}
+        columns = [referred[name] for name in present + missing]
+        values = df[present[0]].dropna().unique().tolist()
+        rows = []
+        for start in range(0, len(values), CHUNK_SIZE):
+            chunk = values[start:start + CHUNK_SIZE]
+            rows.extend(conn.execute(select(*columns).where(referred[present[0]].in_(chunk))).all())
+        keys = pd.DataFrame(rows, columns=present + missing)
+
+        # Each row must match a single parent row, otherwise the merge would duplicate it
+        ambiguous = keys[keys.duplicated(present, keep=False)].merge(df[present].drop_duplicates(), on=present)
+        if len(ambiguous):
+            raise ValueError(
+                "Cannot fill %s: %s matches several rows of %s; provide %s in the DataFrame"
+                % (", ".join(missing), ambiguous[present].iloc[0].to_dict(), fk.referred_table.name, ", ".join(missing))
+            )
+
+        df = df.merge(keys, on=present, how="left")
+    return df
+
+
+def _fill_defaults(table, df):
+    """
+    Replace missing values with the column's default (e.g., False for the
+    Pipe flags), since an explicit NULL would bypass the database default.
+    """
+    for col in table.columns:
+        if col.name not in df.columns or col.default is None or not col.default.is_scalar:
+            continue
+
+        value = col.default.arg
+        if isinstance(value, Enum):
+            value = value.value
+        df = df.assign(**{col.name: df[col.name].astype(object).where(df[col.name].notna(), value)})
+    return df
+
+
+def _copy_postgresql(conn, table, columns, df, chunksize):
+    """
+    Stream the rows into a PostgreSQL table using COPY ... FROM STDIN.
+    """
+    preparer = conn.dialect.identifier_preparer
+    sql = "COPY {} ({}) FROM STDIN".format(
+        preparer.format_table(table),
+        ", ".join(preparer.quote(name) for name in columns),
+    )
+
+    with conn.connection.cursor() as cursor:
+        with cursor.copy(sql) as copy:
+            for rows in _iter_rows(df, chunksize):
+                for row in rows:
+                    copy.write_row(row)
+
+
+def _insert_executemany(conn, table, columns, df, chunksize):
+    """
+    Insert the rows with one multi-row executemany call per chunk.
+    """
+    for rows in _iter_rows(df, chunksize):
+        conn.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+
+
+def copy_load(engine, model, df, chunksize=CHUNK_SIZE, defer_indexes=False):
+    """
+    Bulk load a pandas DataFrame into the table of a SQLAlchemy model.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.Engine
+        SQLAlchemy engine connected to the target database.
+    model : Base subclass
+        SQLAlchemy ORM model class corresponding to the target table.
+    df : pandas.DataFrame
+        DataFrame containing the data to be inserted.
+        Column names should match the attributes of `model`.
+    chunksize : int, optional
+        Number of rows sent to the database per call. Default is 10,000.
+    defer_indexes : bool, optional
+        If True, the table's secondary indexes are dropped during the load
+        and rebuilt afterwards. Use it for initial or bulk imports into a
+        large table (e.g., WeatherObservation); the drop is committed before
+        the load, so an interrupted load leaves the table without these
+        indexes until they are recreated. Default is False.
+
+    Notes
+    -----
+    - Category names are translated to lookup table identifiers (e.g., a
+      "Material" column fills "Material_ID").
+    - The value columns of the former weather tables ("Intensity",
+      "Humidity_value", "Temperature_value") are loaded into
+      WeatherObservation.Value, with the matching Variable.
+    - Point locations are built from "X_coordinate" and "Y_coordinate"
+      columns (e.g., for Manhole or WeatherStation).
+    - Composite foreign keys only partly present in the DataFrame are
+      completed from the referenced table (e.g., a Defect DataFrame only
+      needs "Inspection_ID"; "Inspection_date" is read from Inspection).
+      A ValueError is raised if a key matches several referenced rows.
+    - Missing values in columns with a default (e.g., the Pipe flags or
+      Inspection_status) are replaced by that default instead of NULL.
+    - Only the DataFrame columns that exist in the model's table are loaded;
+      the remaining table columns take their database default. Generated
+      columns (e.g., Date_epoch_s) are always computed by the database.
+    - All chunks are loaded in a single transaction.
+    - It assumes the table is already created in the database.
+    """
+    if defer_indexes:
+        with deferred_indexes(engine, model):
+            copy_load(engine, model, df, chunksize, defer_indexes=False)
+        return
+
+    table = model.__table__
+
+    with engine.begin() as conn:
+        df = _encode_lookups(conn, table, df)
+        df = _weather_values(table, df)
+        df = _points_from_coordinates(table, df)
+        df = _fill_parent_keys(conn, table, df)
+        df = _fill_defaults(table, df)
+        columns = [
+            col.name for col in table.columns
+            if col.name in df.columns and col.computed is None
+        ]
+        df = df[columns]
+
+        if conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg":
+            _copy_postgresql(conn, table, columns, df, chunksize)
+        else:
+            _insert_executemany(conn, table, columns, df, chunksize)
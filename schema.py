@@ -17,6 +17,23 @@ Section 2: Defects
 Section 3: Failures
     Records failure events affecting the sewer system, including their causes,
     impacts, and connection to pipe interventions.
+
+Section 4: Analytical Views
+    Read-only, pre-aggregated views of the tables above, used as features
+    for deterioration modeling.
+
+Relationship Loading
+--------------------
+Relationships are declared with lazy="raise": accessing one that was not
+loaded with the query raises an error instead of silently issuing one query
+per object. Load them explicitly, e.g.:
+
+    select(Pipe).options(
+        selectinload(Pipe.inspection).selectinload(Inspection.defects)
+    )
+
+The one-to-one Pipe.hydraulic_properties is always loaded in the same query
+(lazy="joined").
 """
 
 """
@@ -29,12 +46,332 @@ of each sewer pipe. The following entities are included:
 """
 
 # Imports and Base Class Definition
+import re
+from enum import Enum as PyEnum
+
 from sqlalchemy import (
-    Column, Integer, String, Float, Date, DateTime, ForeignKey,Boolean
+    Column, Integer, SmallInteger, BigInteger, String, Text, Float, Numeric, Date, DateTime, ForeignKey,Boolean, Index,
+    CheckConstraint, Enum, Identity, Computed, DDL, event, MetaData, Table, ForeignKeyConstraint, false, func, text,
+    and_, or_, TypeDecorator
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.schema import PrimaryKeyConstraint
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
+from geoalchemy2 import Geometry
+
+# Naming convention for constraints and indexes, so every generated name is
+# deterministic (e.g., fk_defect_Inspection_ID_inspection) instead of being
+# chosen by the database
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+metadata = MetaData(naming_convention=NAMING_CONVENTION)
+
+Base = declarative_base(metadata=metadata)
+
+"""
+Controlled Vocabularies
+"""
+
+class WorkStatus(PyEnum):
+    """Status of an inspection or intervention."""
+    COMPLETED = "completed"
+    IN_PROGRESS = "in progress"
+    CANCELLED = "cancelled"
+
+
+class PriorityLevel(PyEnum):
+    """Priority level assigned to an intervention."""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+class WeatherVariable(PyEnum):
+    """Climate variable recorded by a weather station."""
+    RAINFALL = "rainfall"
+    HUMIDITY = "humidity"
+    TEMPERATURE = "temperature"
+
+
+class PlanningType(PyEnum):
+    """Whether an intervention was planned or a reaction to a failure."""
+    PLANNED = "planned"
+    REACTIVE = "reactive"
+
+
+class FailureType(PyEnum):
+    """General category of a failure event."""
+    FLOODING = "flooding"
+    BLOCKAGE = "blockage"
+    COLLAPSE = "collapse"
+    OTHER = "other"
+
+
+# Spatial reference system of all geometries (EPSG:2193, NZTM2000).
+# Set it to the projected coordinate system used by the network data.
+SRID = 2193
+
+
+class SpatialLocation(TypeDecorator):
+    """
+    Column type of the spatial locations: a PostGIS geometry on PostgreSQL,
+    and EWKT text (e.g., "SRID=2193;POINT(1570000 5180000)") on other
+    databases, so SQLite needs no spatial extension. Spatial indexes are
+    declared separately (see spatial_index).
+    """
+    impl = Text
+    cache_ok = True
+    # Read by GeoAlchemy2 when the table is created on PostgreSQL
+    spatial_index = False
+
+    def __init__(self, geometry_type, srid=SRID):
+        super().__init__()
+        self.geometry_type = geometry_type
+        self.srid = srid
+
+    def load_dialect_impl(self, dialect):
+        if dialect is not None and dialect.name == "postgresql":
+            return dialect.type_descriptor(Geometry(self.geometry_type, srid=self.srid, spatial_index=False))
+        return self.impl_instance
+
+
+# Identifier type of high-volume tables: BIGINT, except on SQLite, where an
+# identifier is only auto-numbered when it is the rowid, which must be declared
+# INTEGER. Composite keys rely on _sqlite_primary_key for that.
+BigIntegerID = BigInteger().with_variant(Integer, "sqlite")
+
+# Number of identity values each PostgreSQL session reserves at a time, so bulk
+# loads do not access the underlying sequence once per row
+IDENTITY_CACHE = 1000
+
+# Years covered by the yearly partitions of time-partitioned tables (PostgreSQL).
+# Dates outside this range are stored in a default partition.
+PARTITION_YEARS = range(2000, 2031)
+
+# Number of hash partitions of the pipe seismic impacts (PostgreSQL)
+SEISMIC_IMPACT_PARTITIONS = 8
+
+
+def add_yearly_partitions(table, years=PARTITION_YEARS):
+    """
+    Creates one partition per year, plus a default partition, when a table
+    partitioned by RANGE on a date column is created on PostgreSQL.
+    """
+    statements = [
+        f"CREATE TABLE {table.name}_{year} PARTITION OF {table.name} "
+        f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        for year in years
+    ]
+    statements.append(f"CREATE TABLE {table.name}_default PARTITION OF {table.name} DEFAULT")
+
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+@compiles(PrimaryKeyConstraint, "sqlite")
+def _sqlite_primary_key(constraint, compiler, **kw):
+    """
+    Partitioned tables have a composite primary key (identity column plus
+    partition key), which SQLite cannot auto-number. On SQLite, the identity
+    column alone is the primary key (an auto-numbered rowid), and the full
+    key is kept as a UNIQUE constraint for the foreign keys that reference it.
+    Tables outside this schema's metadata are compiled as usual.
+    """
+    if constraint.table.metadata is not metadata:
+        return compiler.visit_primary_key_constraint(constraint, **kw)
+
+    identity = [col for col in constraint.columns if col.identity is not None]
+    if len(constraint.columns) < 2 or len(identity) != 1:
+        return compiler.visit_primary_key_constraint(constraint, **kw)
+
+    preparer = compiler.preparer
+    sql = ""
+    if constraint.name is not None:
+        sql += "CONSTRAINT %s " % preparer.format_constraint(constraint)
+    return sql + "PRIMARY KEY (%s), UNIQUE (%s)" % (
+        preparer.format_column(identity[0]),
+        ", ".join(preparer.format_column(col) for col in constraint.columns),
+    )
+
+
+def value_enum(enum_class, name):
+    """
+    Enum column type that stores the member values (e.g., "in progress")
+    rather than the member names. PostgreSQL stores it as a native ENUM type.
+    """
+    return Enum(
+        enum_class,
+        name=name,
+        native_enum=True,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
+class epoch_seconds(FunctionElement):
+    """
+    Seconds since 1970-01-01 (UTC) of a date column, as a BIGINT. Used by
+    the generated *_epoch_s columns, which time-based features can read as
+    plain integers instead of converting dates row by row.
+    """
+    type = BigInteger()
+    name = "epoch_seconds"
+    inherit_cache = True
+
+
+@compiles(epoch_seconds, "postgresql")
+def _epoch_seconds_postgresql(element, compiler, **kw):
+    return "CAST(EXTRACT(EPOCH FROM %s) AS BIGINT)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(epoch_seconds, "sqlite")
+def _epoch_seconds_sqlite(element, compiler, **kw):
+    return "CAST(strftime('%%s', %s) AS INTEGER)" % compiler.process(element.clauses, **kw)
+
+
+# Text search configuration of the full-text indexes (PostgreSQL)
+TEXT_SEARCH_CONFIG = "english"
+
+
+def text_search_vector(column):
+    """
+    tsvector of a free-text column, as stored in its full-text index.
+    """
+    return func.to_tsvector(
+        text(f"'{TEXT_SEARCH_CONFIG}'"),
+        func.coalesce(column, text("''")),
+    )
+
+
+def spatial_index(column):
+    """
+    GiST index on a location column (PostgreSQL only).
+    """
+    return Index(
+        f"ix_{column.table.name}_{column.name.lower()}_gist",
+        column,
+        postgresql_using="gist",
+    ).ddl_if(dialect="postgresql")
 
-Base = declarative_base()
+
+def full_text_index(column):
+    """
+    GIN index on the tsvector of a free-text column (PostgreSQL only).
+    """
+    return Index(
+        f"ix_{column.table.name}_{column.name.lower()}_gin",
+        text_search_vector(column),
+        postgresql_using="gin",
+    ).ddl_if(dialect="postgresql")
+
+
+def _search_terms(query):
+    """
+    Splits a web search query into groups of (phrase, negated) terms, one
+    group per "or". Terms of a group must all match; any group may match.
+    """
+    groups = [[]]
+    for token in re.findall(r'-?"[^"]*"|\S+', query):
+        if token.lower() == "or":
+            groups.append([])
+            continue
+        phrase = token.lstrip("-").strip('"').lower()
+        if phrase:
+            groups[-1].append((phrase, token.startswith("-")))
+    return tuple(tuple(group) for group in groups if group)
+
+
+class text_search(FunctionElement):
+    """
+    Keyword search on a free-text column, e.g.
+    select(Defect).where(text_search(Defect.Comments, "root or blockage")).
+
+    On PostgreSQL the query uses web search syntax and is answered from the
+    column's full-text index. Other databases approximate it with
+    case-insensitive substring matches: words must all appear, "or" separates
+    alternatives, "quoted phrases" match as a whole and "-word" excludes.
+    """
+    type = Boolean()
+    name = "text_search"
+    inherit_cache = True
+    # The parsed terms shape the SQL, so they are part of the cache key
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("terms", InternalTraversal.dp_plain_obj),
+    ]
+
+    def __init__(self, column, query):
+        self.terms = _search_terms(query) if isinstance(query, str) else None
+        super().__init__(column, query)
+
+
+@compiles(text_search)
+def _text_search_default(element, compiler, **kw):
+    column, query = element.clauses
+    column = func.lower(column)
+    if element.terms is None:
+        return compiler.process(column.contains(func.lower(query)), **kw)
+
+    groups = []
+    for group in element.terms:
+        matches = []
+        for phrase, negated in group:
+            match = column.contains(phrase, autoescape=True)
+            matches.append(~match if negated else match)
+        groups.append(and_(*matches))
+    return compiler.process(or_(*groups).self_group() if groups else false(), **kw)
+
+
+@compiles(text_search, "postgresql")
+def _text_search_postgresql(element, compiler, **kw):
+    column, query = element.clauses
+    tsquery = func.websearch_to_tsquery(text(f"'{TEXT_SEARCH_CONFIG}'"), query)
+    return compiler.process(text_search_vector(column).op("@@")(tsquery), **kw)
+
+"""
+0. Pipe Category Lookup Tables
+"""
+
+def lookup_table(class_name, tablename):
+    """
+    Creates a small lookup (dimension) table with an integer identifier and
+    a unique name. Low-cardinality Pipe attributes (e.g., material, shape)
+    reference these tables instead of repeating the same text in every row.
+    """
+    return type(
+        class_name,
+        (Base,),
+        {
+            "__doc__": f"Lookup table of pipe {tablename.replace('_', ' ')} categories.",
+            "__tablename__": tablename,
+            "__table_args__": {"info": {"lookup": True}},
+            # Unique identifier of the category, assigned by the database (SMALLINT;
+            # INTEGER on SQLite, which only auto-numbers an INTEGER primary key)
+            "id": Column(SmallInteger().with_variant(Integer, "sqlite"), primary_key=True),
+            # Category name as reported in the source data (e.g., PVC)
+            "name": Column(String(64), unique=True, nullable=False),
+        },
+    )
+
+Material = lookup_table("Material", "material")
+SewageType = lookup_table("SewageType", "sewage_type")
+Shape = lookup_table("Shape", "shape")
+LandUseAndCover = lookup_table("LandUseAndCover", "land_use_and_cover")
+Bedding = lookup_table("Bedding", "bedding")
+JointType = lookup_table("JointType", "joint_type")
+SewerCategory = lookup_table("SewerCategory", "sewer_category")
+InstallationMethod = lookup_table("InstallationMethod", "installation_method")
+BackfillType = lookup_table("BackfillType", "backfill_type")
+Manufacturer = lookup_table("Manufacturer", "manufacturer")
+LiningType = lookup_table("LiningType", "lining_type")
+SoilType = lookup_table("SoilType", "soil_type")
+SoilMoisture = lookup_table("SoilMoisture", "soil_moisture")
+TrafficLoad = lookup_table("TrafficLoad", "traffic_load")
 
 """
 1. Pipe Entity
@@ -49,6 +386,20 @@ class Pipe(Base):
 
     __tablename__ = "pipe"
 
+    __table_args__ = (
+        # Gradients beyond +/-100 % are data entry errors
+        CheckConstraint('"Slope" BETWEEN -100 AND 100', name="ck_pipe_slope"),
+        # Covering index with the features most used for modeling, so they
+        # are read from the index alone (PostgreSQL index-only scans)
+        Index(
+            "ix_pipe_features",
+            "Pipe_ID",
+            postgresql_include=[
+                "Material_ID", "Diameter", "Installation_year", "Pipe_length", "Depth", "Slope",
+            ],
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # -------------------------
     # PRIMARY KEY
     # -------------------------
@@ -59,50 +410,50 @@ class Pipe(Base):
     # ATTRIBUTES
     # -------------------------
 
-    # Year in which the pipe was installed
-    Installation_year = Column(Integer, nullable=True)
+    # Year in which the pipe was installed (SMALLINT: up to 32,767)
+    Installation_year = Column(SmallInteger, nullable=True)
 
-    # Nominal internal diameter of the pipe (mm)
-    Diameter = Column(Integer, nullable=True)
+    # Nominal internal diameter of the pipe (mm) (SMALLINT: up to 32,767 mm)
+    Diameter = Column(SmallInteger, nullable=True)
 
     # Construction material of the pipe (e.g., PVC, PE, VC, AC, CONC, etc.)
-    Material = Column(String(20), nullable=True)
+    Material_ID = Column(SmallInteger, ForeignKey("material.id"), nullable=True, index=True)
 
     # Distance between upstream and downstream manholes (m)
     Pipe_length = Column(Float, nullable=True)
 
-    # Gradient of the pipe from upstream to downstream manhole (%)
-    Slope = Column(Float, nullable=True)
+    # Gradient of the pipe from upstream to downstream manhole (%) (NUMERIC(5,2): -999.99 to 999.99)
+    Slope = Column(Numeric(5, 2, asdecimal=False), nullable=True)
 
-    # Average vertical distance from ground level to the pipe crown (m)
-    Depth = Column(Float, nullable=True)
+    # Average vertical distance from ground level to the pipe crown (m) (NUMERIC(5,2): up to 999.99 m)
+    Depth = Column(Numeric(5, 2, asdecimal=False), nullable=True)
 
     # Type of fluids handled by the pipe (e.g., wastewater, stormwater)
-    Sewage_type = Column(String, nullable=True)
+    Sewage_type_ID = Column(SmallInteger, ForeignKey("sewage_type.id"), nullable=True, index=True)
 
     # Elevation of groundwater beneath the ground surface (m)
     Groundwater_level = Column(Float, nullable=True)
 
-    # Number of trees within a user-defined buffer around the pipe
-    Trees_nearby = Column(Integer, nullable=True)
+    # Number of trees within a user-defined buffer around the pipe (SMALLINT: up to 32,767)
+    Trees_nearby = Column(SmallInteger, nullable=True)
 
     # Cross-sectional shape of the pipe (e.g.,circular, oviform)
-    Shape = Column(String, nullable=True)
+    Shape_ID = Column(SmallInteger, ForeignKey("shape.id"), nullable=True, index=True)
 
     # Type of human activity at the pipe location (land use / land cover)(e.g., residential, business)
-    Land_use_and_cover = Column(String, nullable=True)
+    Land_use_and_cover_ID = Column(SmallInteger, ForeignKey("land_use_and_cover.id"), nullable=True, index=True)
 
     # Type of support material placed beneath and around the pipe (e.g.,A-concrete, B-well compacted granular material)
-    Bedding = Column(String, nullable=True)
+    Bedding_ID = Column(SmallInteger, ForeignKey("bedding.id"), nullable=True, index=True)
 
     # Type of joint used to connect pipe segments (e.g., Mortar joint, Rubber ring)
-    Joint_type = Column(String, nullable=True)
+    Joint_type_ID = Column(SmallInteger, ForeignKey("joint_type.id"), nullable=True, index=True)
 
     # Number of residents served by the pipe catchment
     Population = Column(Integer, nullable=True)
 
-    # Number of property connections to the pipe
-    Sewer_connections = Column(Integer, nullable=True)
+    # Number of property connections to the pipe (SMALLINT: up to 32,767)
+    Sewer_connections = Column(SmallInteger, nullable=True)
 
     # Climatic characteristics of the area where the pipe is located
     # (This parameter may be represented using climatic indices such as the Thornthwaite Moisture Index (TMI)
@@ -110,71 +461,76 @@ class Pipe(Base):
     Climatic_condition = Column(Float, nullable=True)
 
     # Classification of the sewer system (e.g., Transmission, Local)
-    Sewer_category = Column(String, nullable=True)
+    Sewer_category_ID = Column(SmallInteger, ForeignKey("sewer_category.id"), nullable=True, index=True)
 
     # Identifier of the nearest weather station
     Weather_station_ID = Column(Integer, nullable=True)
 
     # Technique used to install the pipe (e.g., Trench, Trenchless)
-    Installation_method = Column(String, nullable=True)
+    Installation_method_ID = Column(SmallInteger, ForeignKey("installation_method.id"), nullable=True, index=True)
 
     # Material used to fill the trench around the pipe
-    Backfill_type = Column(String, nullable=True)
+    Backfill_type_ID = Column(SmallInteger, ForeignKey("backfill_type.id"), nullable=True, index=True)
 
     # Company that produced the pipe
-    Manufacturer = Column(String, nullable=True)
+    Manufacturer_ID = Column(SmallInteger, ForeignKey("manufacturer.id"), nullable=True, index=True)
 
     # Assessed quality or condition of the installation work
     # (This parameter can be reported at different stages of the construction process. It may include written comments or
     # inspection notes from which relevant information can later be extracted.)
-    Construction_quality = Column(String, nullable=True)
+    Construction_quality = Column(Text, nullable=True)
 
     # Type of internal lining used for rehabilitation (e.g., CIPP, PVC liner)
-    Lining_type = Column(String, nullable=True)
+    Lining_type_ID = Column(SmallInteger, ForeignKey("lining_type.id"), nullable=True, index=True)
 
-    # Expected service life of the pipe according to design standards (years)
-    Design_life = Column(Integer, nullable=True)
+    # Expected service life of the pipe according to design standards (years) (SMALLINT: up to 32,767)
+    Design_life = Column(SmallInteger, nullable=True)
 
     # Ground surface elevation from DEM (m)
     Ground_level = Column(Float, nullable=True)
 
-    # Pipe wall thickness (mm)
-    Wall_thickness = Column(Float, nullable=True)
+    # Pipe wall thickness (mm) (NUMERIC(5,1): up to 9,999.9 mm)
+    Wall_thickness = Column(Numeric(5, 1, asdecimal=False), nullable=True)
 
     # Indicates if the pipe is affected by tidal fluctuations
-    Tidal_influence = Column(Boolean, nullable=True)
+    Tidal_influence = Column(Boolean, nullable=False, default=False, server_default=false())
 
     # Indicates if the area experiences freeze–thaw cycles
-    Frost_Action = Column(Boolean, nullable=True)
+    Frost_Action = Column(Boolean, nullable=False, default=False, server_default=false())
 
     # Water quality condition based on chemical, physical, and biological parameters
     # (Depend on each indicator. If more indicators are added, each will have its own unit.)
     Water_quality = Column(Float, nullable=True)
 
     # Condition when flow exceeds pipe capacity
-    Surcharge = Column(Boolean, nullable=True)
+    Surcharge = Column(Boolean, nullable=False, default=False, server_default=false())
 
-    # Number of commercial properties connected to the pipe
-    No_of_commercial_properties = Column(Integer, nullable=True)
+    # Number of commercial properties connected to the pipe (SMALLINT: up to 32,767)
+    No_of_commercial_properties = Column(SmallInteger, nullable=True)
 
     # Number of upstream users directly connected
     No_of_direct_upstream_users = Column(Integer, nullable=True)
 
     # Identifier of the seismic activity characteristics near the pipe
-    Seismic_activity_ID = Column(Integer, nullable=True)
+    Seismic_activity_ID = Column(
+        Integer,
+        ForeignKey("seismic_activity.Seismic_activity_ID"),
+        nullable=True,
+        index=True,
+    )
 
     # -------------------------
     # SOIL PROPERTIES (GEOSPATIAL RELATIONSHIP)
     # -------------------------
 
-     # Soil acidity or alkalinity (pH value)
-    Soil_pH = Column(Float, nullable=True)
+    # Soil acidity or alkalinity (pH value) (NUMERIC(4,2): up to 99.99)
+    Soil_pH = Column(Numeric(4, 2, asdecimal=False), nullable=True)
 
     # Soil classification type (e.g., clay, silt, sand, loam)
-    Soil_type = Column(String, nullable=True)
+    Soil_type_ID = Column(SmallInteger, ForeignKey("soil_type.id"), nullable=True, index=True)
 
     # Soil moisture content or moisture classification
-    Soil_moisture = Column(String, nullable=True)
+    Soil_moisture_ID = Column(SmallInteger, ForeignKey("soil_moisture.id"), nullable=True, index=True)
 
     # Electrical resistivity of the soil (ohm·m), related to corrosion risk
     Soil_resistivity = Column(Float, nullable=True)
@@ -184,23 +540,24 @@ class Pipe(Base):
     # -------------------------
 
     #Intensity of vehicle load acting on the surface above the pipe (e.g., Class A Non-traffic, Class B Light Vehicle)
-    Traffic_load=Column(String, nullable=True)
+    Traffic_load_ID=Column(SmallInteger, ForeignKey("traffic_load.id"), nullable=True, index=True)
 
     #Is there a municipal road running or crossing  over the pipe?
-    Road_above=Column(Boolean, nullable=True)
+    Road_above=Column(Boolean, nullable=False, default=False, server_default=false())
 
     #Does the pipe pass under a building?
-    Building_above=Column(Boolean, nullable=True)
+    Building_above=Column(Boolean, nullable=False, default=False, server_default=false())
 
 
     # Relationships to factor entities (one pipe -> one or many records)
-    Weather_station_ID = Column(Integer, ForeignKey("weather_station.Weather_station_ID"))
+    Weather_station_ID = Column(Integer, ForeignKey("weather_station.Weather_station_ID"), index=True)
 
     # Upstream manhole identifier (FK)
     Manhole_up_ID = Column(
         Integer,
         ForeignKey("manhole.Manhole_ID"),
         nullable=True,
+        index=True,
     )
 
     # Downstream manhole identifier (FK)
@@ -208,21 +565,43 @@ class Pipe(Base):
         Integer,
         ForeignKey("manhole.Manhole_ID"),
         nullable=True,
+        index=True,
     )
 
+    # Pipe alignment from the upstream to the downstream manhole (line in the SRID coordinate system).
+    # On PostgreSQL it is derived from the manhole locations when not provided.
+    Location = Column(SpatialLocation("LINESTRING"), nullable=True)
+
 
     # -------------------------
     # ORM RELATIONSHIPS
     # -------------------------
 
     # One weather station can be associated with many pipes
-    weather_station = relationship("WeatherStation", back_populates="pipes")
+    weather_station = relationship("WeatherStation", back_populates="pipes", lazy="raise")
+
+    # Category lookups (one category -> many pipes)
+    material = relationship("Material", lazy="raise")
+    sewage_type = relationship("SewageType", lazy="raise")
+    shape = relationship("Shape", lazy="raise")
+    land_use_and_cover = relationship("LandUseAndCover", lazy="raise")
+    bedding = relationship("Bedding", lazy="raise")
+    joint_type = relationship("JointType", lazy="raise")
+    sewer_category = relationship("SewerCategory", lazy="raise")
+    installation_method = relationship("InstallationMethod", lazy="raise")
+    backfill_type = relationship("BackfillType", lazy="raise")
+    manufacturer = relationship("Manufacturer", lazy="raise")
+    lining_type = relationship("LiningType", lazy="raise")
+    soil_type = relationship("SoilType", lazy="raise")
+    soil_moisture = relationship("SoilMoisture", lazy="raise")
+    traffic_load = relationship("TrafficLoad", lazy="raise")
 
     # Upstream and downstream manholes (each manhole may be linked to many pipes)
     upstream_manhole = relationship(
         "Manhole",
         foreign_keys=[Manhole_up_ID],
         back_populates="pipes_upstream",
+        lazy="raise",
     )
 
     # Relationship to downstream manhole (one manhole -> many downstream pipes)
@@ -230,6 +609,7 @@ class Pipe(Base):
         "Manhole",
         foreign_keys=[Manhole_down_ID],
         back_populates="pipes_downstream",
+        lazy="raise",
     )
 
     # One-to-one relationship: each pipe has a single hydraulic properties record
@@ -237,32 +617,86 @@ class Pipe(Base):
         "HydraulicProperties",
         back_populates="pipe",
         uselist=False,
+        lazy="joined",
     )
 
     # One-to-many relationship: a pipe can have multiple intervention records
     interventions = relationship(
         "InterventionHistory",
         back_populates="pipe",
+        lazy="raise",
     )
 
     # One-to-many relationship: a pipe can have multiple failure records
     failures = relationship(
         "Failure",
         back_populates="pipe",
+        lazy="raise",
+    )
+
+    # Seismic activity characteristics near the pipe (one event -> many pipes)
+    seismic_activity = relationship(
+        "SeismicActivity",
+        back_populates="pipes",
+        lazy="raise",
     )
 
     # One-to-many relationship: each pipe can have a many seismic impact record
     seismic_impact = relationship(
         "PipeSeismicImpact",
-        back_populates="pipe"
+        back_populates="pipe",
+        lazy="raise",
     )
 
     # One-to-many relationship: a pipe can have multiple inspection records
     inspection = relationship(
         "Inspection",
         back_populates="pipe",
+        lazy="raise",
     )
 
+# PostGIS is required for the geometry columns (PostgreSQL)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS postgis").execute_if(dialect="postgresql"),
+)
+
+# Derive the pipe alignment from its upstream and downstream manholes (PostgreSQL)
+event.listen(
+    Pipe.__table__,
+    "after_create",
+    DDL("""
+CREATE OR REPLACE FUNCTION pipe_location_from_manholes() RETURNS trigger AS $$
+BEGIN
+    IF NEW."Location" IS NULL OR TG_OP = 'UPDATE' THEN
+        NEW."Location" := ST_MakeLine(
+            (SELECT "Location" FROM manhole WHERE "Manhole_ID" = NEW."Manhole_up_ID"),
+            (SELECT "Location" FROM manhole WHERE "Manhole_ID" = NEW."Manhole_down_ID")
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""").execute_if(dialect="postgresql"),
+)
+
+event.listen(
+    Pipe.__table__,
+    "after_create",
+    DDL("""
+CREATE TRIGGER pipe_location
+BEFORE INSERT OR UPDATE OF "Manhole_up_ID", "Manhole_down_ID" ON pipe
+FOR EACH ROW EXECUTE FUNCTION pipe_location_from_manholes()
+""").execute_if(dialect="postgresql"),
+)
+
+event.listen(
+    Pipe.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS pipe_location_from_manholes()").execute_if(dialect="postgresql"),
+)
+
 """
  2. Weather_station Entity
 _____
@@ -278,140 +712,104 @@ class WeatherStation(Base):
     # Unique identifier of the weather station (primary key)
     Weather_station_ID = Column(Integer, primary_key=True)
 
-    # X coordinate of the weather station location (e.g. NZTM, UTM, etc.)
-    X_coordinate = Column(Float, nullable=True)
-
-    # Y coordinate of the weather station location
-    Y_coordinate = Column(Float, nullable=True)
+    # Location of the weather station (point in the SRID coordinate system, e.g. NZTM)
+    Location = Column(SpatialLocation("POINT"), nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
     # -------------------------
 
     # One weather station can be linked to many pipes
-    pipes = relationship("Pipe", back_populates="weather_station")
-
-    # One weather station can have many air temperature records
-    air_temperature_records = relationship(
-        "AirTemperature",
-        back_populates="weather_station",
-    )
-
-    # One weather station can have many air humidity records
-    air_humidity_records = relationship(
-        "AirHumidity",
-        back_populates="weather_station",
-    )
+    pipes = relationship("Pipe", back_populates="weather_station", lazy="raise")
 
-    # One weather station can have many rainfall records
-    rainfall_records = relationship(
-        "Rainfall",
+    # One weather station can have many climate observations
+    observations = relationship(
+        "WeatherObservation",
         back_populates="weather_station",
+        lazy="raise",
     )
 
 
-class Rainfall(Base):
+class WeatherObservation(Base):
     """
-    Rainfall observations associated with a weather station. Each record
-    corresponds to rainfall statistics measured at a given time.
-    """
-    __tablename__ = "rainfall"
+    Climate observations (rainfall, air humidity, air temperature) associated
+    with a weather station. Each record stores one statistic of one climate
+    variable measured at a given time.
 
-    # Weather station where the rainfall was observed (FK + part of the PK)
-    Weather_station_ID = Column(
-        Integer,
-        ForeignKey("weather_station.Weather_station_ID")
+    On PostgreSQL the table is list-partitioned by Variable, with one
+    partition per climate variable (e.g., weather_observation_rainfall).
+    """
+    __tablename__ = "weather_observation"
+
+    # Composite index for station + variable + time-range lookups
+    __table_args__ = (
+        Index(
+            "ix_weather_observation_ws_var_obs",
+            "Weather_station_ID",
+            "Variable",
+            "Observation_time",
+        ),
+        {"postgresql_partition_by": 'LIST ("Variable")'},
     )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    # Date (and optionally time) when the rainfall measurement or aggregation period ended.
-    Observation_time = Column(Date)
-
-    # Time interval or aggregation period of rainfall observation. (e.g. hourly, daily, monthly)
-    Frequency = Column(String, nullable=True)
-
-    # Type of statistical value represented by the record. (e.g. mean, max, min)
-    Statistics = Column(String, nullable=True)
-
-    # Amount of rainfall recorded per unit time, or cumulative rainfall depth during the observation period.
-    Intensity = Column(Float, nullable=True)
-
     # -------------------------
-    # ORM RELATIONSHIPS
+    # PRIMARY KEY
     # -------------------------
-    weather_station = relationship(
-        "WeatherStation",
-        back_populates="rainfall_records",
-    )
+    # Unique identifier of the observation record (identity column)
+    Observation_ID = Column(BigIntegerID, Identity(cache=IDENTITY_CACHE), primary_key=True)
 
+    # Climate variable observed (rainfall, humidity, temperature).
+    # Part of the primary key, as required by the PostgreSQL partitioning.
+    Variable = Column(
+        value_enum(WeatherVariable, "weather_variable_enum"),
+        primary_key=True,
+    )
 
-class AirHumidity(Base):
-    """
-    Air humidity observations associated with a weather station.
-    """
-    __tablename__ = "air_humidity"
-
-    air_humidity_id = Column(Integer, primary_key=True)
+    # -------------------------
+    # OBSERVATION ATTRIBUTES
+    # -------------------------
 
-    # Weather station where humidity was observed (FK)
+    # Weather station where the variable was observed (FK)
     Weather_station_ID = Column(
         Integer,
-        ForeignKey("weather_station.Weather_station_ID")
+        ForeignKey("weather_station.Weather_station_ID"),
     )
 
-    # Date (and optionally time) when the air humidity was observed or recorded
+    # Date (and optionally time) when the observation or aggregation period ended.
     Observation_time = Column(Date)
 
+    # Observation_time in seconds since 1970-01-01 (generated by the database)
+    Observation_time_epoch_s = Column(BigInteger, Computed(epoch_seconds(Observation_time), persisted=True), index=True)
+
     # Time interval or aggregation period of the observation (e.g. hourly, daily, monthly)
     Frequency = Column(String, nullable=True)
 
     # Type of statistical value represented by the record (e.g. mean, max, min)
     Statistics = Column(String, nullable=True)
 
-    # Recorded air humidity value for the corresponding period and station (e.g. relative humidity in %)
-    Humidity_value = Column(Float, nullable=True)
+    # Recorded value for the corresponding period and station. The unit depends on the variable:
+    # rainfall intensity or cumulative depth (mm), relative humidity (%), air temperature (°C)
+    Value = Column(Float, nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
     # -------------------------
     weather_station = relationship(
         "WeatherStation",
-        back_populates="air_humidity_records",
+        back_populates="observations",
+        lazy="raise",
     )
 
 
-class AirTemperature(Base):
-    """
-    Air temperature observations associated with a weather station.
-    """
-    __tablename__ = "air_temperature"
-
-    # Weather station where temperature was observed
-    Weather_station_ID = Column(
-        Integer,
-        ForeignKey("weather_station.Weather_station_ID")
-    )
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-
-    # Date (and optionally time) when the air temperature was observed or recorded
-    Observation_time = Column(Date)
-
-    # Time interval or aggregation period of the observation(e.g. hourly, daily, monthly)
-    Frequency = Column(String, nullable=True)
-
-    # Type of statistical value represented by the record (e.g. mean, max, min)
-    Statistics = Column(String, nullable=True)
-
-    # Recorded air temperature value for the corresponding period and station (°C)
-    Temperature_value = Column(Float, nullable=True)
-
-    # -------------------------
-    # ORM RELATIONSHIPS
-    # -------------------------
-    weather_station = relationship(
-        "WeatherStation",
-        back_populates="air_temperature_records",
+# One PostgreSQL partition per climate variable
+for variable in WeatherVariable:
+    event.listen(
+        WeatherObservation.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE weather_observation_{variable.name.lower()} "
+            f"PARTITION OF weather_observation FOR VALUES IN ('{variable.value}')"
+        ).execute_if(dialect="postgresql"),
     )
 
 """
@@ -422,23 +820,29 @@ class PipeSeismicImpact(Base):
 
     __tablename__ = "pipe_seismic_impact"
 
+    __table_args__ = {"postgresql_partition_by": 'HASH ("Seismic_activity_ID")'}
+
     # -------------------------
     # PRIMARY KEY
     # -------------------------
-    # Unique identifier of the seismic activity record
-    Pipe_ID = Column(
-        Integer,
-        ForeignKey("pipe.Pipe_ID"),
-        nullable=False,
-    )
+    # A pipe is linked at most once to the same seismic event: the record is
+    # identified by the event and the pipe (in this order, so the primary key
+    # also serves lookups of the pipes affected by an event)
 
+    # Seismic event affecting the pipe (FK)
     Seismic_activity_ID = Column(
         Integer,
         ForeignKey("seismic_activity.Seismic_activity_ID"),
-        nullable=False,
+        primary_key=True,
     )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Pipe affected by the seismic event (FK)
+    Pipe_ID = Column(
+        Integer,
+        ForeignKey("pipe.Pipe_ID"),
+        primary_key=True,
+        index=True,
+    )
 
     # -------------------------
     # ORM RELATIONSHIPS
@@ -448,12 +852,25 @@ class PipeSeismicImpact(Base):
     pipe = relationship(
         "Pipe",
         back_populates="seismic_impact",
+        lazy="raise",
     )
 
     # Many pipe-seismic-impact records can reference the same seismic activity
     seismic_activity = relationship(
         "SeismicActivity",
         back_populates="pipe_impacts",
+        lazy="raise",
+    )
+
+# Hash partitions of the pipe seismic impacts by seismic event (PostgreSQL)
+for remainder in range(SEISMIC_IMPACT_PARTITIONS):
+    event.listen(
+        PipeSeismicImpact.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE pipe_seismic_impact_{remainder} PARTITION OF pipe_seismic_impact "
+            f"FOR VALUES WITH (MODULUS {SEISMIC_IMPACT_PARTITIONS}, REMAINDER {remainder})"
+        ).execute_if(dialect="postgresql"),
     )
 
 class SeismicActivity(Base):
@@ -465,6 +882,14 @@ class SeismicActivity(Base):
 
     __tablename__ = "seismic_activity"
 
+    __table_args__ = (
+        CheckConstraint('"Magnitude" BETWEEN 0 AND 10', name="ck_seismic_activity_magnitude"),
+        CheckConstraint(
+            '"peak_ground_acceleration" BETWEEN 0 AND 3',
+            name="ck_seismic_activity_peak_ground_acceleration",
+        ),
+    )
+
     # -------------------------
     # PRIMARY KEY
     # -------------------------
@@ -481,6 +906,9 @@ class SeismicActivity(Base):
     # Date (and optionally time) on which the seismic event occurred
     Reference_date = Column(Date, nullable=True)
 
+    # Reference_date in seconds since 1970-01-01 (generated by the database)
+    Reference_date_epoch_s = Column(BigInteger, Computed(epoch_seconds(Reference_date), persisted=True), index=True)
+
     # Measure of the energy released by the seismic event, usually expressed
     # in the Richter or moment magnitude scale. (e.g., moment magnitude Mw)
     Magnitude = Column(Float, nullable=True)
@@ -488,15 +916,12 @@ class SeismicActivity(Base):
     # Depth below the ground surface where the seismic event originated (km)
     Depth_km = Column(Float, nullable=True)
 
-    # X-coordinate of the seismic event epicenter.
-    X_coordinate = Column(Float, nullable=True)
-
-    # Y-coordinate of the seismic event epicenter.
-    Y_coordinate = Column(Float, nullable=True)
+    # Location of the seismic event epicenter (point in the SRID coordinate system).
+    Location = Column(SpatialLocation("POINT"), nullable=True)
 
     #the maximum acceleration experienced by the ground during an earthquake, expressed
-    # as a fraction or percentage of the acceleration due to gravity (g).
-    peak_ground_acceleration = Column(Float, nullable=True)
+    # as a fraction or percentage of the acceleration due to gravity (g). (NUMERIC(4,3): up to 9.999 g)
+    peak_ground_acceleration = Column(Numeric(4, 3, asdecimal=False), nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
@@ -506,12 +931,14 @@ class SeismicActivity(Base):
     pipes = relationship(
         "Pipe",
         back_populates="seismic_activity",
+        lazy="raise",
     )
 
     # Many pipe-seismic-impact records can reference the same seismic activity
     pipe_impacts = relationship(
         "PipeSeismicImpact",
         back_populates="seismic_activity",
+        lazy="raise",
     )
 
 """
@@ -540,11 +967,8 @@ class Manhole(Base):
     # MANHOLE ATTRIBUTES
     # -------------------------
 
-    # X coordinate of downstream manhole. (e.g., NZTM, UTM, etc.)
-    X_coordinate = Column(Float, nullable=True)
-
-    # Y coordinate of downstream manhole.
-    Y_coordinate = Column(Float, nullable=True)
+    # Location of the manhole (point in the SRID coordinate system, e.g., NZTM, UTM, etc.)
+    Location = Column(SpatialLocation("POINT"), nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
@@ -555,6 +979,7 @@ class Manhole(Base):
         "Pipe",
         foreign_keys="Pipe.Manhole_up_ID",
         back_populates="upstream_manhole",
+        lazy="raise",
     )
 
     # Pipes whose downstream end is this manhole
@@ -562,6 +987,139 @@ class Manhole(Base):
         "Pipe",
         foreign_keys="Pipe.Manhole_down_ID",
         back_populates="downstream_manhole",
+        lazy="raise",
+    )
+
+"""
+## 4.1. Pipe_edge Entity
+____________
+"""
+class PipeEdge(Base):
+    """
+    The sewer network as a directed graph: one edge per pipe, from its
+    upstream manhole to its downstream manhole. Network traversals (e.g.,
+    database.upstream_manholes) follow these edges through their indexes
+    instead of scanning the pipe table.
+
+    The table mirrors Pipe.Manhole_up_ID and Pipe.Manhole_down_ID and is
+    maintained by triggers on the pipe table: it should not be written to
+    directly.
+    """
+    __tablename__ = "pipe_edge"
+
+    __table_args__ = (
+        Index("ix_pipe_edge_from", "Manhole_from_ID", "Manhole_to_ID"),
+        Index("ix_pipe_edge_to", "Manhole_to_ID", "Manhole_from_ID"),
+    )
+
+    # -------------------------
+    # PRIMARY KEY / FOREIGN KEY
+    # -------------------------
+    # Pipe connecting the two manholes (one edge per pipe)
+    Pipe_ID = Column(
+        Integer,
+        ForeignKey("pipe.Pipe_ID", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # -------------------------
+    # EDGE ATTRIBUTES
+    # -------------------------
+
+    # Upstream manhole of the pipe (copied from Pipe.Manhole_up_ID)
+    Manhole_from_ID = Column(Integer, ForeignKey("manhole.Manhole_ID"), nullable=True)
+
+    # Downstream manhole of the pipe (copied from Pipe.Manhole_down_ID)
+    Manhole_to_ID = Column(Integer, ForeignKey("manhole.Manhole_ID"), nullable=True)
+
+    # -------------------------
+    # ORM RELATIONSHIPS
+    # -------------------------
+
+    # Pipe represented by the edge (read-only, the edge is maintained by triggers)
+    pipe = relationship("Pipe", viewonly=True, lazy="raise")
+
+# Copy the pipes that already exist when the edge table is created
+event.listen(
+    PipeEdge.__table__,
+    "after_create",
+    DDL("""
+INSERT INTO pipe_edge ("Pipe_ID", "Manhole_from_ID", "Manhole_to_ID")
+SELECT "Pipe_ID", "Manhole_up_ID", "Manhole_down_ID" FROM pipe
+"""),
+)
+
+# Keep the edges in sync with the pipe manholes (PostgreSQL)
+event.listen(
+    PipeEdge.__table__,
+    "after_create",
+    DDL("""
+CREATE OR REPLACE FUNCTION pipe_edge_from_pipe() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO pipe_edge ("Pipe_ID", "Manhole_from_ID", "Manhole_to_ID")
+    VALUES (NEW."Pipe_ID", NEW."Manhole_up_ID", NEW."Manhole_down_ID")
+    ON CONFLICT ("Pipe_ID") DO UPDATE
+    SET "Manhole_from_ID" = EXCLUDED."Manhole_from_ID",
+        "Manhole_to_ID" = EXCLUDED."Manhole_to_ID";
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""").execute_if(dialect="postgresql"),
+)
+
+event.listen(
+    PipeEdge.__table__,
+    "after_create",
+    DDL("""
+CREATE TRIGGER pipe_edge
+AFTER INSERT OR UPDATE OF "Manhole_up_ID", "Manhole_down_ID" ON pipe
+FOR EACH ROW EXECUTE FUNCTION pipe_edge_from_pipe()
+""").execute_if(dialect="postgresql"),
+)
+
+event.listen(
+    PipeEdge.__table__,
+    "before_drop",
+    DDL("DROP TRIGGER IF EXISTS pipe_edge ON pipe").execute_if(dialect="postgresql"),
+)
+
+event.listen(
+    PipeEdge.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS pipe_edge_from_pipe()").execute_if(dialect="postgresql"),
+)
+
+# Keep the edges in sync with the pipe manholes (SQLite). Deleted pipes are
+# handled here too, since SQLite does not enforce foreign keys by default.
+SQLITE_PIPE_EDGE_TRIGGERS = {
+    "pipe_edge_insert": """
+CREATE TRIGGER pipe_edge_insert AFTER INSERT ON pipe
+BEGIN
+    INSERT OR REPLACE INTO pipe_edge ("Pipe_ID", "Manhole_from_ID", "Manhole_to_ID")
+    VALUES (NEW."Pipe_ID", NEW."Manhole_up_ID", NEW."Manhole_down_ID");
+END
+""",
+    "pipe_edge_update": """
+CREATE TRIGGER pipe_edge_update AFTER UPDATE OF "Manhole_up_ID", "Manhole_down_ID" ON pipe
+BEGIN
+    INSERT OR REPLACE INTO pipe_edge ("Pipe_ID", "Manhole_from_ID", "Manhole_to_ID")
+    VALUES (NEW."Pipe_ID", NEW."Manhole_up_ID", NEW."Manhole_down_ID");
+END
+""",
+    "pipe_edge_delete": """
+CREATE TRIGGER pipe_edge_delete AFTER DELETE ON pipe
+BEGIN
+    DELETE FROM pipe_edge WHERE "Pipe_ID" = OLD."Pipe_ID";
+END
+""",
+}
+
+for trigger, statement in SQLITE_PIPE_EDGE_TRIGGERS.items():
+    event.listen(PipeEdge.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        PipeEdge.__table__,
+        "before_drop",
+        DDL(f"DROP TRIGGER IF EXISTS {trigger}").execute_if(dialect="sqlite"),
     )
 
 """
@@ -616,6 +1174,7 @@ class HydraulicProperties(Base):
     pipe = relationship(
         "Pipe",
         back_populates="hydraulic_properties",
+        lazy="raise",
     )
 
 """
@@ -633,8 +1192,8 @@ class InterventionHistory(Base):
     # -------------------------
     # PRIMARY KEY
     # -------------------------
-    # Unique identifier of the intervention record
-    Intervention_ID = Column(Integer, primary_key=True, autoincrement=True)
+    # Unique identifier of the intervention record (identity column)
+    Intervention_ID = Column(BigIntegerID, Identity(cache=IDENTITY_CACHE), primary_key=True)
 
     # -------------------------
     # TEMPORAL INFORMATION
@@ -654,19 +1213,20 @@ class InterventionHistory(Base):
     Type_of_intervention = Column(String, nullable=True)
 
     # Indicates whether the intervention was part of a planned maintenance program or performed in response to an unexpected failure. (e.g., reactive, planned)
-    Planned_or_reactive = Column(String, nullable=True)
+    Planned_or_reactive = Column(value_enum(PlanningType, "planning_type_enum"), nullable=True)
 
     # Current status of the intervention. (e.g., completed, in progress, cancelled)
-    Status = Column(String, nullable=True)
+    Status = Column(value_enum(WorkStatus, "intervention_status_enum"), nullable=True)
 
     # Priority level assigned to the intervention, typically based on urgency or risk. (e.g., low, medium, high)
-    Priority = Column(String, nullable=True)
+    Priority = Column(value_enum(PriorityLevel, "priority_enum"), nullable=True)
 
     # Identifier of the pipe where the intervention was carried out (FK)
     Pipe_ID = Column(
         Integer,
         ForeignKey("pipe.Pipe_ID"),
         nullable=False,
+        index=True,
     )
 
     # Longitudinal position (distance along the pipe) where the intervention begins, measured from the upstream end (m)
@@ -676,7 +1236,7 @@ class InterventionHistory(Base):
     Position_end = Column(Float, nullable=True)
 
     # Additional notes or remarks describing the intervention.
-    Comments = Column(String, nullable=True)
+    Comments = Column(Text, nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
@@ -686,11 +1246,13 @@ class InterventionHistory(Base):
     pipe = relationship(
         "Pipe",
         back_populates="interventions",
+        lazy="raise",
     )
 
     failures = relationship(
         "Failure",
         back_populates="intervention",
+        lazy="raise",
     )
 
 """
@@ -711,41 +1273,58 @@ class Inspection (Base):
     Represents a CCTV or inspection carried out on a specific pipe.
     Each record describes one inspection event, including its date, coverage
     length, status and an overall condition rating.
+
+    On PostgreSQL the table is range-partitioned by year on Date.
     """
 
     __tablename__='inspection'
 
+    __table_args__ = (
+        # Condition grades range from 1 (very good) to 5 (very poor)
+        CheckConstraint('"Condition_rating" BETWEEN 1 AND 5', name="ck_inspection_condition_rating"),
+        {"postgresql_partition_by": 'RANGE ("Date")'},
+    )
+
     #--------------------
     # Primary-Key
     #--------------------
 
-    #Unique identifier for each inspection record.
-    Inspection_ID=Column(Integer,primary_key=True)
+    #Unique identifier for each inspection record (identity column).
+    Inspection_ID=Column(Integer, Identity(), primary_key=True)
 
     #Foreign key linking the inspection to the corresponding pipe that was surveyed.
-    Pipe_ID=Column(Integer, ForeignKey("pipe.Pipe_ID"),nullable=False)
+    Pipe_ID=Column(Integer, ForeignKey("pipe.Pipe_ID"),nullable=False, index=True)
 
     # -------------------------
     # INSPECTION ATTRIBUTES
     # -------------------------
 
-    # Date when the inspection was carried out
-    Date = Column(Date, nullable=True)
+    # Date when the inspection was carried out.
+    # Part of the primary key, as required by the PostgreSQL partitioning.
+    Date = Column(Date, primary_key=True)
+
+    # Date in seconds since 1970-01-01 (generated by the database)
+    Date_epoch_s = Column(BigInteger, Computed(epoch_seconds(Date), persisted=True), index=True)
 
-    # Overall condition rating assigned to the pipe based on this inspection
-    Condition_rating = Column(Integer, nullable=True)
+    # Overall condition rating assigned to the pipe based on this inspection (SMALLINT: up to 32,767)
+    Condition_rating = Column(SmallInteger, nullable=True)
 
     # Length of pipe that was inspected (m)
     Survey_length = Column(Float, nullable=True)
 
-    # Status of the inspection (e.g., completed, in progress, cancelled)
-    Inspection_status = Column(String, nullable=True)
+    # Status of the inspection (e.g., completed, in progress, cancelled). Defaults to completed.
+    Inspection_status = Column(
+        value_enum(WorkStatus, "inspection_status_enum"),
+        nullable=False,
+        default=WorkStatus.COMPLETED,
+        server_default=WorkStatus.COMPLETED.value,
+    )
 
     #The manhole from which the inspection started (e.g.,upstream, downstream)
     Starting_manhole=Column(String, nullable=True)
 
     #Additional notes recorded by the operator or analyst regarding the inspection conditions or anomalies.
-    Comments=Column(String, nullable=True)
+    Comments=Column(Text, nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
@@ -755,12 +1334,14 @@ class Inspection (Base):
     pipe = relationship(
         "Pipe",
         back_populates="inspection",
+        lazy="raise",
     )
 
     # One inspection can have many defects (Inspection 1 -> N Defects)
     defects = relationship(
         "Defect",
         back_populates="inspection",
+        lazy="raise",
     )
 
 """
@@ -772,33 +1353,58 @@ class Defect(Base):
     Represents a single defect observed during an inspection. Each record
     includes the main defect code, characterization, quantification and
     the position of the defect along the pipe.
+
+    On PostgreSQL the table is range-partitioned by year on the date of
+    its inspection (Inspection_date).
     """
     __tablename__ = "defect"
 
+    __table_args__ = (
+        # Defect codes are short, non-empty abbreviations
+        CheckConstraint("\"Main_defect_code\" <> ''", name="ck_defect_main_defect_code"),
+        # Clock positions around the pipe circumference (0 to 12)
+        CheckConstraint('"Circumferential_start" BETWEEN 0 AND 12', name="ck_defect_circumferential_start"),
+        CheckConstraint('"Circumferential_end" BETWEEN 0 AND 12', name="ck_defect_circumferential_end"),
+        # Defects of an inspection, covering the most used defect attributes
+        # (INCLUDE columns are only stored on PostgreSQL)
+        Index(
+            "ix_defect_insp_cover",
+            "Inspection_ID",
+            postgresql_include=["Main_defect_code", "Quantification", "Longitudinal_distance"],
+        ),
+        # An inspection is identified by its ID and date (see Inspection)
+        ForeignKeyConstraint(
+            ["Inspection_ID", "Inspection_date"],
+            ["inspection.Inspection_ID", "inspection.Date"],
+        ),
+        {"postgresql_partition_by": 'RANGE ("Inspection_date")'},
+    )
+
     # -------------------------
     # PRIMARY KEY
     # -------------------------
 
-    # Unique identifier of the defect record
-    Defect_ID = Column(Integer, primary_key=True, autoincrement=True)
+    # Unique identifier of the defect record (identity column)
+    Defect_ID = Column(BigIntegerID, Identity(cache=IDENTITY_CACHE), primary_key=True)
 
     # -------------------------
     # RELATIONSHIP TO INSPECTION
     # -------------------------
 
     # Foreign key linking the defect record to the corresponding  inspection where the defect was observed.
-    Inspection_ID = Column(
-        Integer,
-        ForeignKey("inspection.Inspection_ID"),
-        nullable=False,
-    )
+    Inspection_ID = Column(Integer, nullable=False)
+
+    # Date of the inspection where the defect was observed (copied from Inspection.Date).
+    # Part of the primary key, as required by the PostgreSQL partitioning. It is set
+    # together with Inspection_ID when a defect is linked through Defect.inspection.
+    Inspection_date = Column(Date, primary_key=True)
 
     # -------------------------
     # DEFECT ATTRIBUTES
     # -------------------------
 
     # Code or abbreviation representing the primary type of defect, typically following a standard classification
-    Main_defect_code = Column(String, nullable=False)
+    Main_defect_code = Column(String(8), nullable=False, index=True)
 
     # Additional code describing the nature  of the defect, complementing the main defect code.
     Characterization_code = Column(String, nullable=True)
@@ -809,14 +1415,14 @@ class Defect(Base):
     # Distance from the starting manhole of the pipe to the location of the defect (m).
     Longitudinal_distance = Column(Float, nullable=True)
 
-    # Clock position (from 0 to 12) indicating where the defect begins around the inner circumference of the pipe, using the pipe’s crown as the 12 o’clock reference.
-    Circumferential_start = Column(Integer, nullable=True)
+    # Clock position (from 0 to 12) indicating where the defect begins around the inner circumference of the pipe, using the pipe’s crown as the 12 o’clock reference. (SMALLINT: up to 32,767)
+    Circumferential_start = Column(SmallInteger, nullable=True)
 
-    # Clock position (from 0 to 12) indicating where the defect ends around the inner circumference of the pipe, using the same reference as Circumferential_start.
-    Circumferential_end = Column(Integer, nullable=True)
+    # Clock position (from 0 to 12) indicating where the defect ends around the inner circumference of the pipe, using the same reference as Circumferential_start. (SMALLINT: up to 32,767)
+    Circumferential_end = Column(SmallInteger, nullable=True)
 
     # Free-text notes providing additional details or context about the defect.
-    Comments = Column(String, nullable=True)
+    Comments = Column(Text, nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
@@ -826,6 +1432,7 @@ class Defect(Base):
     inspection = relationship(
         "Inspection",
         back_populates="defects",
+        lazy="raise",
     )
 
 """
@@ -840,14 +1447,18 @@ class Failure(Base):
     Represents a failure event associated with a pipe and, when available,
     with a specific intervention. Each record describes the type of failure,
     when it occurred, its cause and the damage caused.
+
+    On PostgreSQL the table is range-partitioned by year on Date.
     """
     __tablename__ = "failure"
 
+    __table_args__ = {"postgresql_partition_by": 'RANGE ("Date")'}
+
     # -------------------------
     # PRIMARY KEY
     # -------------------------
-    # Unique identifier of the failure event
-    Failure_ID = Column(Integer, primary_key=True, autoincrement=True)
+    # Unique identifier of the failure event (identity column)
+    Failure_ID = Column(BigIntegerID, Identity(cache=IDENTITY_CACHE), primary_key=True)
 
     # -------------------------
     # RELATIONSHIPS (FOREIGN KEYS)
@@ -858,14 +1469,16 @@ class Failure(Base):
         Integer,
         ForeignKey("pipe.Pipe_ID"),
         nullable=False,
+        index=True,
     )
 
     # Identifier of the intervention associated with this failure (FK)
     # This can be nullable if not every failure is linked to a recorded intervention.
     Intervention_ID = Column(
-        Integer,
+        BigIntegerID,
         ForeignKey("intervention_history.Intervention_ID"),
         nullable=True,
+        index=True,
     )
 
     # -------------------------
@@ -873,10 +1486,14 @@ class Failure(Base):
     # -------------------------
 
     # General category or type of failure (e.g., flooding, blockage, collapse)
-    Type_of_failure = Column(String, nullable=True)
+    Type_of_failure = Column(value_enum(FailureType, "failure_type_enum"), nullable=True)
 
-    # Date when the failure occurred
-    Date = Column(Date, nullable=True)
+    # Date when the failure occurred.
+    # Part of the primary key, as required by the PostgreSQL partitioning.
+    Date = Column(Date, primary_key=True)
+
+    # Date in seconds since 1970-01-01 (generated by the database)
+    Date_epoch_s = Column(BigInteger, Computed(epoch_seconds(Date), persisted=True), index=True)
 
     # Description of the main cause of the failure, if known. (e.g., roots, debris, structural collapse)
     Cause = Column(String, nullable=True)
@@ -885,10 +1502,10 @@ class Failure(Base):
     Cause_location = Column(String, nullable=True)
 
     # Description of the damage or impact resulting from the failure (e.g., flooding, service disruption, road damage).
-    Damage_caused = Column(String, nullable=True)
+    Damage_caused = Column(Text, nullable=True)
 
     # Additional notes or comments about the failure event
-    Comments = Column(String, nullable=True)
+    Comments = Column(Text, nullable=True)
 
     # -------------------------
     # ORM RELATIONSHIPS
@@ -898,6 +1515,7 @@ class Failure(Base):
     pipe = relationship(
         "Pipe",
         back_populates="failures",
+        lazy="raise",
     )
 
     # Each failure may be associated with one intervention history record
@@ -905,5 +1523,107 @@ class Failure(Base):
     intervention = relationship(
         "InterventionHistory",
         back_populates="failures",
+        lazy="raise",
     )
 
+# Yearly PostgreSQL partitions of the time-partitioned tables
+add_yearly_partitions(Inspection.__table__)
+add_yearly_partitions(Defect.__table__)
+add_yearly_partitions(Failure.__table__)
+
+# Spatial indexes of the locations (PostgreSQL)
+spatial_index(Pipe.__table__.c.Location)
+spatial_index(WeatherStation.__table__.c.Location)
+spatial_index(SeismicActivity.__table__.c.Location)
+spatial_index(Manhole.__table__.c.Location)
+
+# Full-text indexes of the searchable free-text columns (see text_search)
+full_text_index(InterventionHistory.__table__.c.Comments)
+full_text_index(Inspection.__table__.c.Comments)
+full_text_index(Defect.__table__.c.Comments)
+full_text_index(Failure.__table__.c.Damage_caused)
+full_text_index(Failure.__table__.c.Comments)
+
+"""
+# Section 4: Analytical Views
+==================
+
+This section defines pre-aggregated, read-only views built from the tables
+above. On PostgreSQL they are materialized views (refreshed with
+database.refresh_views()); on other databases they are plain views.
+"""
+
+# Number of defects, worst condition rating and last inspection date per pipe
+PIPE_CONDITION_SUMMARY_SQL = """
+SELECT p."Pipe_ID",
+       COUNT(d."Defect_ID") AS "Defect_count",
+       MAX(i."Condition_rating") AS "Worst_condition_rating",
+       MAX(i."Date") AS "Last_inspection_date"
+FROM pipe p
+LEFT JOIN inspection i ON i."Pipe_ID" = p."Pipe_ID"
+LEFT JOIN defect d ON d."Inspection_ID" = i."Inspection_ID" AND d."Inspection_date" = i."Date"
+GROUP BY p."Pipe_ID"
+"""
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS pipe_condition_summary AS"
+        + PIPE_CONDITION_SUMMARY_SQL
+        + "WITH DATA"
+    ).execute_if(dialect="postgresql"),
+)
+
+# Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        'CREATE UNIQUE INDEX IF NOT EXISTS ix_pipe_condition_summary_pipe '
+        'ON pipe_condition_summary ("Pipe_ID")'
+    ).execute_if(dialect="postgresql"),
+)
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE VIEW IF NOT EXISTS pipe_condition_summary AS"
+        + PIPE_CONDITION_SUMMARY_SQL
+    ).execute_if(dialect="sqlite"),
+)
+
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP MATERIALIZED VIEW IF EXISTS pipe_condition_summary").execute_if(dialect="postgresql"),
+)
+
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP VIEW IF EXISTS pipe_condition_summary").execute_if(dialect="sqlite"),
+)
+
+
+class PipeConditionSummary(Base):
+    """
+    Read-only summary of the inspection history of each pipe: number of
+    recorded defects, worst condition rating and date of the last inspection.
+
+    The view is not part of Base.metadata, so create_all() does not try to
+    create it as a table; it is created by the DDL events above.
+    """
+    __table__ = Table(
+        "pipe_condition_summary",
+        MetaData(),
+        # Pipe identifier (one row per pipe)
+        Column("Pipe_ID", Integer, primary_key=True),
+        # Number of defects recorded across all inspections of the pipe
+        Column("Defect_count", Integer),
+        # Worst (highest) condition rating assigned to the pipe
+        Column("Worst_condition_rating", SmallInteger),
+        # Date of the most recent inspection
+        Column("Last_inspection_date", Date),
+    )